@@ -1,5 +1,24 @@
 import { YIN } from 'pitchfinder';
 
+// MIDI 编号 → 音名（含八度）查找表，模块加载时构建一次，
+// getNoteDetail 热路径上不再做字符串拼接和取模运算
+const NOTE_STRINGS = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"];
+const MIDI_NOTE_NAMES = new Array(128);
+for (let midi = 0; midi < 128; midi++) {
+    const octave = Math.floor(midi / 12) - 1;
+    MIDI_NOTE_NAMES[midi] = NOTE_STRINGS[midi % 12] + octave;
+}
+
+// 判断 f2 是否为 f1 的整数次谐波（容差约 3%）
+const isHarmonic = (f1, f2) => {
+    // Check if f2 is a multiple of f1
+    const ratio = f2 / f1;
+    const nearestInt = Math.round(ratio);
+    if (nearestInt < 2) return false; // Not a harmonic (or is fundamental)
+    // Tolerance: 2%
+    return Math.abs(ratio - nearestInt) < 0.03;
+};
+
 class AudioEngine {
     constructor() {
         this.audioContext = null;
@@ -7,6 +26,7 @@ class AudioEngine {
         this.analyser = null;
         this.detectPitch = null;
         this.buffer = null;
+        this.freqBuffer = null;
         this.isListening = false;
 
         // Configuration
@@ -16,6 +36,13 @@ class AudioEngine {
         // Attack/Transient detection
         this.lastVolume = 0;
         this.lastAttackTime = 0;
+        this.volumeThreshold = 0.005; // 噪音门限，单音/多音分析共用
+
+        // 同一音频帧内的分析结果缓存（调音器定时器和练习循环可能在同一帧各调一次）
+        this._lastPitchTime = -1;
+        this._lastPitchResult = null;
+        this._lastPolyTime = -1;
+        this._lastPolyResult = [];
     }
 
     async init() {
@@ -34,6 +61,22 @@ class AudioEngine {
             this.analyser = this.audioContext.createAnalyser();
             this.analyser.fftSize = this.bufferSize;
             this.buffer = new Float32Array(this.analyser.fftSize);
+            // 频域缓冲同样只分配一次，始终保持 float32，不在每次分析时新建
+            this.freqBuffer = new Float32Array(this.analyser.frequencyBinCount);
+
+            // 峰值扫描的频点范围只和采样率/FFT大小有关，启动时算好
+            this.binSize = this.sampleRate / this.analyser.fftSize;
+            this.startBin = Math.floor(70 / this.binSize);   // 跳过 < 70Hz
+            this.endBin = Math.floor(2000 / this.binSize);   // 跳过 > 2000Hz（吉他音域）
+
+            // 预热：先对静音缓冲跑一次 YIN，让 JS 引擎把热循环编译好，
+            // 首个真实音符不用吃冷启动的卡顿。放到下一个宏任务执行，
+            // init()（通常在点击回调里）不被热身本身卡住
+            setTimeout(() => {
+                if (this.detectPitch && this.buffer) {
+                    this.detectPitch(this.buffer);
+                }
+            }, 0);
 
             console.log("AudioEngine initialized. Sample Rate:", this.sampleRate);
         } catch (e) {
@@ -135,19 +178,31 @@ class AudioEngine {
     getPitch() {
         if (!this.isListening || !this.analyser) return null;
 
+        // 同一音频时间点的重复调用直接复用结果，避免二次拷贝缓冲和重跑 YIN
+        const frameTime = this.audioContext.currentTime;
+        if (frameTime === this._lastPitchTime) {
+            return this._lastPitchResult;
+        }
+        this._lastPitchTime = frameTime;
+        this._lastPitchResult = this._analyzePitch();
+        return this._lastPitchResult;
+    }
+
+    _analyzePitch() {
         // Get time domain data (waveform) for pitch detection
         this.analyser.getFloatTimeDomainData(this.buffer);
 
         // === 噪音门限 - 计算音量，忽略弱信号 ===
-        let sum = 0;
+        // 平方累加 + 单次开方（RMS），内层循环不再逐样本调 Math.abs
+        let sumSquares = 0;
         for (let i = 0; i < this.buffer.length; i++) {
-            sum += Math.abs(this.buffer[i]);
+            const s = this.buffer[i];
+            sumSquares += s * s;
         }
-        const averageVolume = sum / this.buffer.length;
+        const averageVolume = Math.sqrt(sumSquares / this.buffer.length);
 
         // 音量阈值（调高到0.005过滤底噪和摩擦音）
-        const volumeThreshold = 0.005;
-        if (averageVolume < volumeThreshold) {
+        if (averageVolume < this.volumeThreshold) {
             this.lastVolume = averageVolume;
             return null; // 音量太小，忽略
         }
@@ -192,19 +247,14 @@ class AudioEngine {
 
     // Helper: Convert frequency to note name and cents
     getNoteDetail(frequency) {
-        const noteStrings = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"];
         // MIDI Note = 69 + 12 * log2(f / 440)
         const midiFloat = 69 + 12 * Math.log2(frequency / 440);
         const midi = Math.round(midiFloat);
         const deviation = midiFloat - midi;
         const cents = Math.floor(deviation * 100);
 
-        const octave = Math.floor(midi / 12) - 1;
-        const noteIndex = midi % 12;
-        const noteName = noteStrings[noteIndex] + octave;
-
         return {
-            note: noteName,
+            note: MIDI_NOTE_NAMES[midi] || '--',
             cents: cents,
             midi: midi
         };
@@ -217,23 +267,34 @@ class AudioEngine {
     getPolyphonicPitch() {
         if (!this.isListening || !this.analyser) return [];
 
+        // 音频时钟没有前进（输入停滞或 AudioContext 挂起）时直接复用上次结果，
+        // 不在陈旧数据上重跑整套 FFT 峰值分析
+        const frameTime = this.audioContext.currentTime;
+        if (frameTime === this._lastPolyTime) {
+            return this._lastPolyResult;
+        }
+        this._lastPolyTime = frameTime;
+        this._lastPolyResult = this._analyzePolyphonic();
+        return this._lastPolyResult;
+    }
+
+    _analyzePolyphonic() {
+        // 静音时直接跳过：练习循环先跑 getPitch()，lastVolume 即当前帧音量，
+        // 低于门限就不必再读频谱、扫峰值
+        if (this.lastVolume < this.volumeThreshold) return [];
+
         // 1. Get Frequency Data
-        const bufferLength = this.analyser.frequencyBinCount; // fftSize / 2
-        const dataArray = new Float32Array(bufferLength);
+        const dataArray = this.freqBuffer; // 复用预分配缓冲，见 init()
         this.analyser.getFloatFrequencyData(dataArray);
 
         // 2. Find Peaks (Simple Peak Picking)
         // Threshold: -70dB (configurable, silence is usually -100dB)
         const threshold = -70; // 使用稳定器过滤噪声，此处保持灵敏
         const peaks = [];
-        const sampleRate = this.sampleRate;
-        const fftSize = this.analyser.fftSize;
-        const binSize = sampleRate / fftSize;
-
-        // Skip very low frequencies (< 70Hz)
-        const startBin = Math.floor(70 / binSize);
-        // Skip very high frequencies (> 2000Hz, guitar range)
-        const endBin = Math.floor(2000 / binSize);
+        // 频点换算常量在 init() 里缓存好
+        const binSize = this.binSize;
+        const startBin = this.startBin;
+        const endBin = this.endBin;
 
         for (let i = startBin; i < endBin; i++) {
             const val = dataArray[i];
@@ -261,12 +322,13 @@ class AudioEngine {
         peaks.sort((a, b) => b.magnitude - a.magnitude);
 
         // 3.5 Relative Peak Filter: discard peaks more than 20dB below the loudest
+        // 已按响度降序排序，原地截断尾部即可，不再 filter + 重建数组
         if (peaks.length > 0) {
-            const loudest = peaks[0].magnitude;
             const relativeThreshold = 20; // dB
-            const filtered = peaks.filter(p => (loudest - p.magnitude) < relativeThreshold);
-            peaks.length = 0;
-            peaks.push(...filtered);
+            const cutoff = peaks[0].magnitude - relativeThreshold;
+            let end = peaks.length;
+            while (end > 1 && peaks[end - 1].magnitude <= cutoff) end--;
+            peaks.length = end;
         }
 
         // 4. Filter Harmonics
@@ -283,24 +345,17 @@ class AudioEngine {
         const detectedNotes = [];
         const maxPolyphony = 4; // 最多识别4个基频
 
-        const isHarmonic = (f1, f2) => {
-            // Check if f2 is a multiple of f1
-            const ratio = f2 / f1;
-            const nearestInt = Math.round(ratio);
-            if (nearestInt < 2) return false; // Not a harmonic (or is fundamental)
-            // Tolerance: 2%
-            return Math.abs(ratio - nearestInt) < 0.03;
-        };
-
         // We also need to handle "Octave errors". 
         // Sometimes the 2nd harmonic is louder than fundamental.
         // For now, simple greedy approach.
 
         const finalizedPeaks = [];
 
-        // Iterative selection
-        while (peaks.length > 0 && finalizedPeaks.length < maxPolyphony) {
-            const currentPeak = peaks.shift(); // Loudest remaining
+        // Iterative selection（下标推进 + 置空标记，代替 shift/splice 反复搬移数组）
+        let cursor = 0;
+        while (cursor < peaks.length && finalizedPeaks.length < maxPolyphony) {
+            const currentPeak = peaks[cursor++]; // Loudest remaining
+            if (currentPeak === null) continue; // 已被标记为前面基频的谐波
 
             let isArtifact = false;
             for (let i = 0; i < finalizedPeaks.length; i++) {
@@ -327,9 +382,9 @@ class AudioEngine {
             }
 
             // Remove harmonics of the current chosen fundamental from candidates
-            for (let i = peaks.length - 1; i >= 0; i--) {
-                if (isHarmonic(currentPeak.frequency, peaks[i].frequency)) {
-                    peaks.splice(i, 1);
+            for (let i = cursor; i < peaks.length; i++) {
+                if (peaks[i] !== null && isHarmonic(currentPeak.frequency, peaks[i].frequency)) {
+                    peaks[i] = null;
                 }
             }
         }
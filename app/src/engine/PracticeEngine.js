@@ -1,5 +1,12 @@
 import AudioEngine from '../audio/AudioEngine';
 
+// MIDI 编号 → 频率表，模块加载时构建一次
+// Freq = 440 * 2^((midi - 69) / 12)
+const MIDI_FREQ = new Float64Array(128);
+for (let m = 0; m < 128; m++) {
+    MIDI_FREQ[m] = 440 * Math.pow(2, (m - 69) / 12);
+}
+
 class PracticeEngine {
     constructor() {
         this.scoreApi = null;
@@ -9,6 +16,7 @@ class PracticeEngine {
         this.lastHitTime = 0;
         this.expectedNotes = [];
         this.isFollowMode = false;
+        this._tuningCache = null; // 每份谱子只查一次弦表（见 getTuning）
 
         // 音符稳定器：过滤瞬态噪声和泛音伪影
         this.noteStabilizer = new Map(); // noteName -> { count, lastFrame, data }
@@ -16,10 +24,20 @@ class PracticeEngine {
         this.STABILITY_THRESHOLD = 2; // 2帧确认即显示 (~33ms at 60fps)
         this.DECAY_FRAMES = 4; // 消失4帧后移除 (~66ms)
         this.MAX_DISPLAY_NOTES = 3; // 最多同时显示3个音符
+
+        // UI 回调合并：分析按帧跑，发布给界面最多 30Hz，始终取最新结果
+        this.PITCH_UI_INTERVAL_MS = 33;
+        this._lastPitchPublish = 0;
+
+        // rAF 回调只绑定一次，循环里不再每帧新建箭头函数
+        this._loopCallback = () => this.loop();
     }
 
     // Connect to Score components
     attachScore(scoreApi) {
+        // 每次（重新）挂接都作废弦表缓存——同一个 API 实例也可能换了新谱子
+        this._tuningCache = null;
+
         // If re-attaching same score, do nothing? Or should we allow update?
         if (this.scoreApi === scoreApi) return;
 
@@ -70,35 +88,45 @@ class PracticeEngine {
                 this.frameCounter++;
                 let rawNotes = polyPitchData.length > 0 ? polyPitchData : (pitchData ? [pitchData] : []);
 
-                for (const note of rawNotes) {
-                    const existing = this.noteStabilizer.get(note.note);
-                    if (existing) {
-                        existing.count++;
-                        existing.lastFrame = this.frameCounter;
-                        existing.data = note;
-                    } else {
-                        this.noteStabilizer.set(note.note, {
-                            count: 1, lastFrame: this.frameCounter, data: note
-                        });
+                // 完全静音且稳定器为空时跳过维护（练习时大多数帧都是静音帧）
+                if (rawNotes.length > 0 || this.noteStabilizer.size > 0) {
+                    for (const note of rawNotes) {
+                        const existing = this.noteStabilizer.get(note.note);
+                        if (existing) {
+                            existing.count++;
+                            existing.lastFrame = this.frameCounter;
+                            existing.data = note;
+                        } else {
+                            this.noteStabilizer.set(note.note, {
+                                count: 1, lastFrame: this.frameCounter, data: note
+                            });
+                        }
                     }
-                }
 
-                // 清理过期音符
-                for (const [name, info] of this.noteStabilizer) {
-                    if (this.frameCounter - info.lastFrame > this.DECAY_FRAMES) {
-                        this.noteStabilizer.delete(name);
+                    // 清理过期音符
+                    for (const [name, info] of this.noteStabilizer) {
+                        if (this.frameCounter - info.lastFrame > this.DECAY_FRAMES) {
+                            this.noteStabilizer.delete(name);
+                        }
                     }
                 }
 
-                // 输出稳定音符（2帧即显示）
-                const stableNotes = [];
-                for (const [, info] of this.noteStabilizer) {
-                    if (info.count >= this.STABILITY_THRESHOLD) {
-                        stableNotes.push(info.data);
+                // 合并发布：界面 30Hz 刷新已足够，避免 60fps 逐帧触发 Vue 更新。
+                // 稳定音符列表只在真正发布的帧构建/排序，跳过帧零开销
+                const nowMs = performance.now();
+                if (nowMs - this._lastPitchPublish >= this.PITCH_UI_INTERVAL_MS) {
+                    this._lastPitchPublish = nowMs;
+
+                    // 输出稳定音符（2帧即显示）
+                    const stableNotes = [];
+                    for (const [, info] of this.noteStabilizer) {
+                        if (info.count >= this.STABILITY_THRESHOLD) {
+                            stableNotes.push(info.data);
+                        }
                     }
+                    stableNotes.sort((a, b) => (b.magnitude || 0) - (a.magnitude || 0));
+                    this.onPitchUpdate(stableNotes.slice(0, this.MAX_DISPLAY_NOTES));
                 }
-                stableNotes.sort((a, b) => (b.magnitude || 0) - (a.magnitude || 0));
-                this.onPitchUpdate(stableNotes.slice(0, this.MAX_DISPLAY_NOTES));
             }
 
             // 2. Get current cursor position in ticks (only if score is loaded)
@@ -142,19 +170,9 @@ class PracticeEngine {
                     for (const note of this.expectedNotes) {
                         if (this.noteStatus.has(note.id)) continue; // Already processed
 
-                        let midi = note.midi;
-                        if (!midi) {
-                            const tuning = this.getTuning(note.string);
-                            if (tuning !== undefined && tuning !== null) {
-                                midi = tuning + note.fret;
-                            }
-                        }
-
-                        if (!midi) continue;
-
-                        // Calculate Note Frequency
-                        // Freq = 440 * 2^((midi - 69) / 12)
-                        const expectedFreq = 440 * Math.pow(2, (midi - 69) / 12);
+                        // midi / 目标频率在 updateExpectedNotes 里已一次性解析好
+                        const expectedFreq = note.expectedFreq;
+                        if (!expectedFreq) continue;
 
                         let matched = false;
 
@@ -207,7 +225,7 @@ class PracticeEngine {
             console.error('PracticeEngine loop error:', e);
         }
 
-        requestAnimationFrame(() => this.loop());
+        requestAnimationFrame(this._loopCallback);
     }
 
     handleNoteHit(note, tick) {
@@ -264,6 +282,19 @@ class PracticeEngine {
             return;
         }
 
+        // 进谱时一次性解析 midi 和目标频率，60fps 匹配循环里不再逐音查弦表、做幂运算
+        if (notes) {
+            for (const n of notes) {
+                if (!n.midi) {
+                    const tuning = this.getTuning(n.string);
+                    if (tuning !== null && tuning !== undefined) {
+                        n.midi = tuning + n.fret;
+                    }
+                }
+                n.expectedFreq = (n.midi && n.midi >= 0 && n.midi < 128) ? MIDI_FREQ[n.midi] : null;
+            }
+        }
+
         // --- ADDED LOGGING FOR USER ---
         if (notes && notes.length > 0) {
             const beatId = notes[0].ref?.beat?.id || 'Unknown Beat';
@@ -271,14 +302,7 @@ class PracticeEngine {
                 ? (notes[0].ref.beat.voice.bar.index + 1) : '?';
 
             const noteNames = notes.map(n => {
-                let midi = n.midi;
-                if (!midi) {
-                    const tuning = this.getTuning(n.string);
-                    if (tuning !== null && tuning !== undefined) {
-                        midi = tuning + n.fret;
-                    }
-                }
-                const expectedFreq = midi ? (440 * Math.pow(2, (midi - 69) / 12)).toFixed(1) + 'Hz' : 'Unknown';
+                const expectedFreq = n.expectedFreq ? n.expectedFreq.toFixed(1) + 'Hz' : 'Unknown';
                 return `[第${n.string}弦${n.fret}品 (${expectedFreq})]`;
             }).join(', ');
 
@@ -308,6 +332,19 @@ class PracticeEngine {
         this.expectedNotes = notes;
     }
 
+    // 把 AlphaTab beat 映射成练习引擎的统一音符载荷
+    // （ScoreViewer 的 playedBeatChanged 和下面的 fetchNotesAtTick 共用同一结构）
+    mapBeatNotes(beat) {
+        return beat.notes.map(n => ({
+            id: n.id,
+            fret: n.value || n.fret, // Handle different AlphaTab versions
+            string: n.string,
+            startTick: beat.start,
+            duration: beat.duration,
+            ref: n
+        }));
+    }
+
     // Manually scan the score for notes at or immediately after a given tick
     fetchNotesAtTick(tick) {
         if (!this.scoreApi || !this.scoreApi.score) {
@@ -345,30 +382,26 @@ class PracticeEngine {
         }
 
         if (targetBeat && targetBeat.notes) {
-            const mappedNotes = targetBeat.notes.map(n => ({
-                id: n.id,
-                fret: n.value || n.fret, // Handle different AlphaTab versions
-                string: n.string,
-                startTick: targetBeat.start,
-                duration: targetBeat.duration,
-                ref: n
-            }));
-            this.updateExpectedNotes(mappedNotes);
+            this.updateExpectedNotes(this.mapBeatNotes(targetBeat));
         } else {
             console.warn("fetchNotesAtTick: Could not find any beat at or after tick", tick);
         }
     }
 
     getTuning(stringIndex) {
+        // 弦表对一份谱子是固定的，缓存后不再逐音符遍历 score 对象树
+        if (this._tuningCache) {
+            return this._tuningCache[stringIndex - 1]; // 0-based array, stringIndex is 1-based
+        }
+
         if (!this.scoreApi || !this.scoreApi.score) return null;
         try {
             const track = this.scoreApi.score.tracks[0];
             const stave = track.staves[0];
-            // Log tuning structure once
-            if (Math.random() < 0.01) console.log("TuningObj:", stave.stringTuning);
 
             // AlphaTab 1.0+: stringTuning.tunings is the array of MIDI values
-            return stave.stringTuning.tunings[stringIndex - 1]; // 0-based array, stringIndex is 1-based
+            this._tuningCache = stave.stringTuning.tunings;
+            return this._tuningCache[stringIndex - 1];
         } catch (e) {
             console.warn("Could not get tuning", e);
             return null;
@@ -24,11 +24,11 @@ const blobToBase64 = (blob) => {
  */
 const base64ToBlob = (base64, type = 'application/octet-stream') => {
     const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
+    // 直接写入 Uint8Array，省掉中间的普通数字数组
+    const byteArray = new Uint8Array(byteCharacters.length);
     for (let i = 0; i < byteCharacters.length; i++) {
-        byteNumbers[i] = byteCharacters.charCodeAt(i);
+        byteArray[i] = byteCharacters.charCodeAt(i);
     }
-    const byteArray = new Uint8Array(byteNumbers);
     return new Blob([byteArray], { type });
 };
 
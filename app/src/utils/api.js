@@ -88,12 +88,12 @@ export const fetchScoreDataFromBackend = async (localId) => {
         const res = await api.get(`/user/history/${localId}/data`);
         if (res.data && res.data.data) {
             // Convert base64 back to Blob
+            // 直接写入 Uint8Array，省掉中间的普通数字数组（大谱子可达数 MB）
             const byteCharacters = atob(res.data.data);
-            const byteNumbers = new Array(byteCharacters.length);
+            const byteArray = new Uint8Array(byteCharacters.length);
             for (let i = 0; i < byteCharacters.length; i++) {
-                byteNumbers[i] = byteCharacters.charCodeAt(i);
+                byteArray[i] = byteCharacters.charCodeAt(i);
             }
-            const byteArray = new Uint8Array(byteNumbers);
             return new Blob([byteArray]);
         }
     } catch (e) {
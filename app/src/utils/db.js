@@ -31,15 +31,24 @@ export const initDB = () => {
     });
 };
 
+// 前缀解析结果按原始字符串缓存：登录态不变时不重复 JSON.parse，
+// 登录/登出改写 localStorage 后第一次调用会自动失效重算
+let cachedUserStr = undefined;
+let cachedPrefix = 'guest_';
+
 const getUserPrefix = () => {
     const userStr = localStorage.getItem('user');
+    if (userStr === cachedUserStr) return cachedPrefix;
+
+    cachedUserStr = userStr;
+    cachedPrefix = 'guest_';
     if (userStr) {
         try {
             const user = JSON.parse(userStr);
-            return user.email ? `${user.email}_` : 'guest_';
+            cachedPrefix = user.email ? `${user.email}_` : 'guest_';
         } catch (e) { }
     }
-    return 'guest_';
+    return cachedPrefix;
 };
 
 export const saveScore = async (id, name, data, addTime = Date.now()) => {
@@ -42,7 +42,15 @@ app.use('/api/user/history', historyRoutes);
 // Serve Vue Frontend
 const path = require('path');
 const frontendPath = path.join(__dirname, '../../app/dist');
-app.use(express.static(frontendPath));
+// 带哈希的构建产物可以长期缓存；HTML 保持 no-cache，新版本发布立即生效
+app.use(express.static(frontendPath, {
+    maxAge: '7d',
+    setHeaders: (res, filePath) => {
+        if (filePath.endsWith('.html')) {
+            res.setHeader('Cache-Control', 'no-cache');
+        }
+    }
+}));
 
 // Fallback for Vue Router History Mode
 app.get('*', (req, res) => {
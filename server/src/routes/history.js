@@ -13,14 +13,18 @@ router.post('/sync', verifyToken, async (req, res) => {
             return res.status(400).json({ message: 'Invalid history format' });
         }
 
-        // Loop through the provided history array from frontend
+        // Fetch all existing records for this batch in one query,
+        // instead of one findOne round-trip per item
+        const ids = history.map(item => item.id);
+        const existingRows = await HistoryScore.findAll({
+            where: { UserId: userId, local_id: ids }
+        });
+        const existingById = new Map(existingRows.map(row => [row.local_id, row]));
+
+        const writes = [];
         for (const item of history) {
             const { id, name, addTime, data } = item;
-
-            // Check if this history item already exists
-            const existing = await HistoryScore.findOne({
-                where: { UserId: userId, local_id: id }
-            });
+            const existing = existingById.get(id);
 
             if (existing) {
                 // Update time if changed. Also update data if provided.
@@ -29,18 +33,19 @@ router.post('/sync', verifyToken, async (req, res) => {
                 if (data) {
                     existing.data = Buffer.from(data, 'base64');
                 }
-                await existing.save();
+                writes.push(existing.save());
             } else {
                 // Create new record
-                await HistoryScore.create({
+                writes.push(HistoryScore.create({
                     UserId: userId,
                     local_id: id,
                     name,
                     addTime,
                     data: data ? Buffer.from(data, 'base64') : Buffer.alloc(0)
-                });
+                }));
             }
         }
+        await Promise.all(writes);
 
         res.json({ message: 'History synced successfully' });
     } catch (error) {